@@ -0,0 +1,66 @@
+"""In-process TTL cache for API-key auth lookups.
+
+Auth re-queries api_keys by key_hash on every request; even indexed,
+that is one round trip each. Repeat lookups within the TTL are served
+from a small per-process dict holding plain tuples (no ORM objects, so
+no session binding leaks). Entries are dropped when the key row is
+updated or deleted in this process; the 30s TTL bounds staleness for
+mutations made elsewhere.
+"""
+
+import time
+from datetime import datetime
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlmodel import col, select
+
+from app.database import get_session
+from app.models import APIKey
+
+CACHE_TTL_SECONDS = 30.0
+CACHE_MAX_ENTRIES = 10_000
+
+# (user_id, organization_id, is_active, expires_at)
+APIKeyAuth = Tuple[int, Optional[int], bool, Optional[datetime]]
+
+_lock = Lock()
+_cache: Dict[str, Tuple[float, Optional[APIKeyAuth]]] = {}
+
+
+def get_api_key_cached(key_hash: str) -> Optional[APIKeyAuth]:
+    """Resolve an API key hash to its auth tuple, hitting the DB at most once per TTL."""
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(key_hash)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+    stmt = select(
+        col(APIKey.user_id), col(APIKey.organization_id), col(APIKey.is_active), col(APIKey.expires_at)
+    ).where(
+        col(APIKey.key_hash) == key_hash,
+        col(APIKey.is_active).is_(True),  # matches the partial ux_api_keys_active_hash index
+    )
+    with get_session() as session:
+        row = session.exec(stmt).first()
+    auth: Optional[APIKeyAuth] = (row[0], row[1], row[2], row[3]) if row is not None else None
+
+    with _lock:
+        if len(_cache) >= CACHE_MAX_ENTRIES:
+            # dict preserves insertion order, so this evicts the oldest entry
+            _cache.pop(next(iter(_cache)))
+        _cache[key_hash] = (now + CACHE_TTL_SECONDS, auth)
+    return auth
+
+
+def invalidate_api_key(key_hash: str) -> None:
+    with _lock:
+        _cache.pop(key_hash, None)
+
+
+@event.listens_for(APIKey, "after_update")
+@event.listens_for(APIKey, "after_delete")
+def _invalidate_on_mutation(mapper, connection, target: APIKey) -> None:
+    invalidate_api_key(target.key_hash)
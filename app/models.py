@@ -1,72 +1,167 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlmodel import SQLModel, Field, Relationship, Column, Session, col
+from sqlalchemy import DateTime, Enum as SAEnum, Index, SmallInteger, func, text
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
-from typing import Optional, List, Dict, Any
-
-
-# Enums for various categorical data
-class UserType(str, Enum):
-    B2C = "b2c"
-    B2B = "b2b"
-
-
-class AccountType(str, Enum):
-    MASTER = "master"
-    MEMBER = "member"
-
-
-class CompanyType(str, Enum):
-    STARTUP = "startup"
-    SME = "sme"
-    CORPORATION = "corporation"
-    NON_PROFIT = "non_profit"
-    GOVERNMENT = "government"
-    OTHER = "other"
-
-
-class CompanySize(str, Enum):
-    MICRO = "micro"  # 1-9 employees
-    SMALL = "small"  # 10-49 employees
-    MEDIUM = "medium"  # 50-249 employees
-    LARGE = "large"  # 250+ employees
-
-
-class PricingPlan(str, Enum):
-    WEEK_PASS = "week_pass"
-    BESTPRICE = "bestprice"
-
-
-class QueryType(str, Enum):
-    LIGHT = "light"
-    MAIN = "main"
-
-
-class Language(str, Enum):
-    BG = "bg"  # Bulgarian
-    CS = "cs"  # Czech
-    DA = "da"  # Danish
-    DE = "de"  # German
-    EL = "el"  # Greek
-    EN = "en"  # English
-    ES = "es"  # Spanish
-    ET = "et"  # Estonian
-    FI = "fi"  # Finnish
-    FR = "fr"  # French
-    GA = "ga"  # Irish
-    HR = "hr"  # Croatian
-    HU = "hu"  # Hungarian
-    IT = "it"  # Italian
-    LT = "lt"  # Lithuanian
-    LV = "lv"  # Latvian
-    MT = "mt"  # Maltese
-    NL = "nl"  # Dutch
-    PL = "pl"  # Polish
-    PT = "pt"  # Portuguese
-    RO = "ro"  # Romanian
-    SK = "sk"  # Slovak
-    SL = "sl"  # Slovenian
-    SV = "sv"  # Swedish
+from enum import IntEnum
+from typing import Optional, List, Dict, Any, Tuple
+from pydantic import ConfigDict, GetCoreSchemaHandler, SerializationInfo, model_serializer
+from pydantic_core import CoreSchema, core_schema
+from sqlalchemy.types import TypeDecorator
+import re
+
+
+def _timestamp_column(*, onupdate: bool = False) -> Column:
+    """Timezone-aware timestamp filled in server-side, keeping INSERTs free of Python clock calls."""
+    if onupdate:
+        return Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    return Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+# Enums for various categorical data. Members are ints so in-process dispatch
+# (`if q.query_type == QueryType.MAIN:`) is a single integer compare; the str
+# code each member maps to in __codes__ stays the wire/storage format. Member
+# numbering is part of that format - append new members, never renumber.
+class CodedIntEnum(IntEnum):
+    """IntEnum whose external representation is the short str code in __codes__."""
+
+    __slots__ = ()
+    __codes__: Tuple[str, ...] = ()
+
+    @property
+    def code(self) -> str:
+        """The str form used in the API and the database."""
+        return type(self).__codes__[self]
+
+    @classmethod
+    def _missing_(cls, value: object):
+        # accept the str codes on input so API payloads keep sending e.g. "en"
+        if isinstance(value, str) and value in cls.__codes__:
+            return cls(cls.__codes__.index(value))
+        return None
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        # serialize as the str code so the JSON wire format matches the old str enums
+        schema = handler(source_type)
+        schema["serialization"] = core_schema.plain_serializer_function_ser_schema(
+            lambda member: member.code, return_schema=core_schema.str_schema(), when_used="json"
+        )
+        return schema
+
+
+class CodedEnumType(TypeDecorator):
+    """Binds CodedIntEnum members as their str codes onto a native PG ENUM and back."""
+
+    impl = SAEnum
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[CodedIntEnum], type_name: str):
+        self.enum_cls = enum_cls
+        super().__init__(*enum_cls.__codes__, name=type_name, native_enum=True)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_cls(value).code
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_cls(value)
+
+
+def _enum_column(enum_cls: type[CodedIntEnum], *, nullable: bool = False) -> Column:
+    """Native Postgres ENUM column storing the str codes (4-byte OID compares instead of VARCHAR)."""
+    type_name = re.sub(r"(?<=[a-z])(?=[A-Z])", "_", enum_cls.__name__).lower()
+    return Column(CodedEnumType(enum_cls, type_name), nullable=nullable)
+
+
+class UserType(CodedIntEnum):
+    __codes__ = ("b2c", "b2b")
+    B2C = 0
+    B2B = 1
+
+
+class AccountType(CodedIntEnum):
+    __codes__ = ("master", "member")
+    MASTER = 0
+    MEMBER = 1
+
+
+class CompanyType(CodedIntEnum):
+    __codes__ = ("startup", "sme", "corporation", "non_profit", "government", "other")
+    STARTUP = 0
+    SME = 1
+    CORPORATION = 2
+    NON_PROFIT = 3
+    GOVERNMENT = 4
+    OTHER = 5
+
+
+class CompanySize(CodedIntEnum):
+    __codes__ = ("micro", "small", "medium", "large")
+    MICRO = 0  # 1-9 employees
+    SMALL = 1  # 10-49 employees
+    MEDIUM = 2  # 50-249 employees
+    LARGE = 3  # 250+ employees
+
+
+class PricingPlan(CodedIntEnum):
+    __codes__ = ("week_pass", "bestprice")
+    WEEK_PASS = 0
+    BESTPRICE = 1
+
+
+class QueryType(CodedIntEnum):
+    __codes__ = ("light", "main")
+    LIGHT = 0
+    MAIN = 1
+
+
+class Language(CodedIntEnum):
+    __codes__ = (
+        "bg", "cs", "da", "de", "el", "en", "es", "et", "fi", "fr", "ga", "hr",
+        "hu", "it", "lt", "lv", "mt", "nl", "pl", "pt", "ro", "sk", "sl", "sv",
+    )  # fmt: skip
+    BG = 0  # Bulgarian
+    CS = 1  # Czech
+    DA = 2  # Danish
+    DE = 3  # German
+    EL = 4  # Greek
+    EN = 5  # English
+    ES = 6  # Spanish
+    ET = 7  # Estonian
+    FI = 8  # Finnish
+    FR = 9  # French
+    GA = 10  # Irish
+    HR = 11  # Croatian
+    HU = 12  # Hungarian
+    IT = 13  # Italian
+    LT = 14  # Lithuanian
+    LV = 15  # Latvian
+    MT = 16  # Maltese
+    NL = 17  # Dutch
+    PL = 18  # Polish
+    PT = 19  # Portuguese
+    RO = 20  # Romanian
+    SK = 21  # Slovak
+    SL = 22  # Slovenian
+    SV = 23  # Swedish
+
+
+# Packed representation of (query_type, language) for the high-volume queries
+# table: query_type in the bits above the low 5, language (24 members) in the
+# low 5 bits. The members' int values are the packed form directly.
+_QUERY_TYPES = tuple(QueryType)
+_LANGUAGES = tuple(Language)
+_LANGUAGE_BITS = 5
+
+
+def pack_qt_lang(query_type: QueryType, language: Language) -> int:
+    """Pack a (query_type, language) pair into the SMALLINT stored on Query.qt_lang."""
+    return (int(query_type) << _LANGUAGE_BITS) | int(language)
 
 
 # Core user management models
@@ -75,17 +170,37 @@ class Organization(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=200)
-    company_type: CompanyType
-    company_size: CompanySize
+    company_type: CompanyType = Field(sa_column=_enum_column(CompanyType))
+    company_size: CompanySize = Field(sa_column=_enum_column(CompanySize))
     headquarters_location: str = Field(max_length=100)
-    subsidiary_locations: List[str] = Field(default=[], sa_column=Column(JSON))
-    sso_enabled: bool = Field(default=False)
-    sso_config: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    sso_enabled: bool = Field(default=False, sa_column_kwargs={"server_default": text("false")})
+    sso_config: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONB))
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
-    users: List["User"] = Relationship(back_populates="organization")
+    users: List["User"] = Relationship(back_populates="organization", sa_relationship_kwargs={"lazy": "selectin"})
     api_keys: List["APIKey"] = Relationship(back_populates="organization")
+    locations: List["OrgLocation"] = Relationship(
+        back_populates="organization", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+
+    @property
+    def subsidiary_locations(self) -> List[str]:
+        """Backward-compatible view of the normalized locations."""
+        return [loc.location for loc in self.locations]
+
+
+class OrgLocation(SQLModel, table=True):
+    """Subsidiary location of an organization, normalized out of a JSON array so SQL can filter on it."""
+
+    __tablename__ = "organization_locations"  # type: ignore[assignment]
+
+    organization_id: int = Field(foreign_key="organizations.id", primary_key=True)
+    location: str = Field(max_length=100, primary_key=True)
+
+    __table_args__ = (Index("ix_org_loc_location", "location"),)
+
+    organization: "Organization" = Relationship(back_populates="locations")
 
 
 class User(SQLModel, table=True):
@@ -93,25 +208,40 @@ class User(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(unique=True, max_length=255)
-    password_hash: str = Field(max_length=255)
-    user_type: UserType
-    account_type: Optional[AccountType] = Field(default=None)
+    user_type: UserType = Field(sa_column=_enum_column(UserType))
+    account_type: Optional[AccountType] = Field(default=None, sa_column=_enum_column(AccountType, nullable=True))
     organization_id: Optional[int] = Field(default=None, foreign_key="organizations.id")
-    is_active: bool = Field(default=True)
-    can_generate_api_keys: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    is_active: bool = Field(default=True, sa_column_kwargs={"server_default": text("true")})
+    can_generate_api_keys: bool = Field(default=False, sa_column_kwargs={"server_default": text("false")})
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
     organization: Optional[Organization] = Relationship(back_populates="users")
     user_context: Optional["UserContext"] = Relationship(
         back_populates="user", sa_relationship_kwargs={"uselist": False}
     )
-    subscriptions: List["Subscription"] = Relationship(back_populates="user")
-    api_keys: List["APIKey"] = Relationship(back_populates="user")
-    chat_sessions: List["ChatSession"] = Relationship(back_populates="user")
-    queries: List["Query"] = Relationship(back_populates="user")
+    subscriptions: List["Subscription"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "selectin"})
+    api_keys: List["APIKey"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "selectin"})
+    chat_sessions: List["ChatSession"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "selectin"})
+    queries: List["Query"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "selectin"})
+    # Rarely traversed collections stay on the default lazy="select" to avoid over-eager loading
     documents: List["Document"] = Relationship(back_populates="user")
     billing_records: List["BillingRecord"] = Relationship(back_populates="user")
+    # Credentials are only needed at login; lazy="raise" keeps everyday user loads narrow
+    auth: Optional["UserAuth"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise", "uselist": False}
+    )
+
+
+class UserAuth(SQLModel, table=True):
+    """Login credentials split off the hot users table; joined explicitly at login only."""
+
+    __tablename__ = "user_auths"  # type: ignore[assignment]
+
+    user_id: int = Field(foreign_key="users.id", primary_key=True)
+    password_hash: str = Field(max_length=255)
+
+    user: User = Relationship(back_populates="auth")
 
 
 class UserContext(SQLModel, table=True):
@@ -121,14 +251,14 @@ class UserContext(SQLModel, table=True):
     user_id: int = Field(foreign_key="users.id", unique=True)
     user_type_context: str = Field(max_length=50)  # "private_person" or "company"
     home_location: str = Field(max_length=100)
-    preferred_language: Language
+    preferred_language: Language = Field(sa_column=_enum_column(Language))
     profession: str = Field(max_length=100)
     personal_notes: str = Field(default="", max_length=2000)
-    context_data: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))  # Additional flexible context
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    context_data: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONB))  # Additional flexible context
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
-    user: User = Relationship(back_populates="user_context")
+    user: User = Relationship(back_populates="user_context", sa_relationship_kwargs={"lazy": "joined"})
 
 
 # API Key management
@@ -136,16 +266,23 @@ class APIKey(SQLModel, table=True):
     __tablename__ = "api_keys"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    key_hash: str = Field(max_length=255, unique=True)
+    key_hash: str = Field(max_length=255)
     name: str = Field(max_length=100)
-    user_id: int = Field(foreign_key="users.id")
+    user_id: int = Field(foreign_key="users.id", index=True)
     organization_id: Optional[int] = Field(default=None, foreign_key="organizations.id")
-    is_active: bool = Field(default=True)
+    is_active: bool = Field(default=True, sa_column_kwargs={"server_default": text("true")})
     last_used_at: Optional[datetime] = Field(default=None)
     expires_at: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
 
-    user: User = Relationship(back_populates="api_keys")
+    __table_args__ = (
+        Index("ix_api_keys_user_active", "user_id", "is_active"),
+        # Auth looks up active keys only; a partial index stays small as revoked keys accumulate.
+        # Lookups must filter on is_active = true to use it.
+        Index("ux_api_keys_active_hash", "key_hash", unique=True, postgresql_where=text("is_active")),
+    )
+
+    user: User = Relationship(back_populates="api_keys", sa_relationship_kwargs={"lazy": "joined"})
     organization: Optional[Organization] = Relationship(back_populates="api_keys")
 
 
@@ -154,37 +291,64 @@ class Subscription(SQLModel, table=True):
     __tablename__ = "subscriptions"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id")
-    pricing_plan: PricingPlan
-    is_active: bool = Field(default=True)
+    user_id: int = Field(foreign_key="users.id", index=True)
+    pricing_plan: PricingPlan = Field(sa_column=_enum_column(PricingPlan))
+    is_active: bool = Field(default=True, sa_column_kwargs={"server_default": text("true")})
+    tokens_used: int = Field(default=0, sa_column_kwargs={"server_default": text("0")})
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
+
+    user: User = Relationship(back_populates="subscriptions", sa_relationship_kwargs={"lazy": "joined"})
+    token_usages: List["TokenUsage"] = Relationship(back_populates="subscription")
+    billing_records: List["BillingRecord"] = Relationship(back_populates="subscription")
+    # Plan-specific columns live in detail tables so every row stops paying for
+    # the other plan's NULLs; only the row matching pricing_plan is populated
+    week_pass: Optional["WeekPassDetail"] = Relationship(
+        back_populates="subscription", sa_relationship_kwargs={"lazy": "joined", "uselist": False}
+    )
+    bestprice: Optional["BestpriceDetail"] = Relationship(
+        back_populates="subscription", sa_relationship_kwargs={"lazy": "joined", "uselist": False}
+    )
 
-    # Week Pass specific fields
-    token_allowance: Optional[int] = Field(default=None)  # Total tokens for week pass
-    tokens_used: int = Field(default=0)
-    week_pass_expires_at: Optional[datetime] = Field(default=None)
-    week_pass_price: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=10)
 
-    # Bestprice Plan specific fields
-    current_price_per_1k_tokens: Optional[Decimal] = Field(default=None, decimal_places=4, max_digits=10)
-    total_tokens_consumed: int = Field(default=0)
+class WeekPassDetail(SQLModel, table=True):
+    """Week-Pass plan details, populated only when pricing_plan == WEEK_PASS."""
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    __tablename__ = "week_pass_details"  # type: ignore[assignment]
 
-    user: User = Relationship(back_populates="subscriptions")
-    token_usages: List["TokenUsage"] = Relationship(back_populates="subscription")
-    billing_records: List["BillingRecord"] = Relationship(back_populates="subscription")
+    subscription_id: int = Field(foreign_key="subscriptions.id", primary_key=True)
+    token_allowance: int  # Total tokens for week pass
+    expires_at: datetime
+    price: Decimal = Field(decimal_places=2, max_digits=10)
+
+    subscription: Subscription = Relationship(back_populates="week_pass")
+
+
+class BestpriceDetail(SQLModel, table=True):
+    """Bestprice plan details, populated only when pricing_plan == BESTPRICE."""
+
+    __tablename__ = "bestprice_details"  # type: ignore[assignment]
+
+    subscription_id: int = Field(foreign_key="subscriptions.id", primary_key=True)
+    # Price per 1k tokens in micro-EUR (EUR x 1_000_000); BIGINT sums far faster than NUMERIC
+    price_per_1k_micros: int
+    total_tokens_consumed: int = Field(default=0, sa_column_kwargs={"server_default": text("0")})
+
+    subscription: Subscription = Relationship(back_populates="bestprice")
 
 
 class TokenUsage(SQLModel, table=True):
     __tablename__ = "token_usages"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    subscription_id: int = Field(foreign_key="subscriptions.id")
+    subscription_id: int = Field(foreign_key="subscriptions.id", index=True)
     query_id: Optional[int] = Field(default=None, foreign_key="queries.id")
     tokens_consumed: int
-    cost: Decimal = Field(decimal_places=4, max_digits=10)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    # Cost in micro-EUR (EUR x 1_000_000); aggregate with SUM(cost_micros) and divide for display
+    cost_micros: int
+    timestamp: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+
+    __table_args__ = (Index("ix_token_usages_sub_ts", "subscription_id", "timestamp"),)
 
     subscription: Subscription = Relationship(back_populates="token_usages")
     query: Optional["Query"] = Relationship(back_populates="token_usage")
@@ -195,16 +359,16 @@ class Document(SQLModel, table=True):
     __tablename__ = "documents"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id")
+    user_id: int = Field(foreign_key="users.id", index=True)
     filename: str = Field(max_length=255)
     original_filename: str = Field(max_length=255)
     file_size: int  # in bytes
     mime_type: str = Field(max_length=100)
     file_path: str = Field(max_length=500)  # Storage path
-    language: Optional[Language] = Field(default=None)
-    processed: bool = Field(default=False)
+    language: Optional[Language] = Field(default=None, sa_column=_enum_column(Language, nullable=True))
+    processed: bool = Field(default=False, sa_column_kwargs={"server_default": text("false")})
     processing_error: Optional[str] = Field(default=None, max_length=1000)
-    uploaded_at: datetime = Field(default_factory=datetime.utcnow)
+    uploaded_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
     processed_at: Optional[datetime] = Field(default=None)
 
     user: User = Relationship(back_populates="documents")
@@ -216,17 +380,19 @@ class ChatSession(SQLModel, table=True):
     __tablename__ = "chat_sessions"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id")
+    user_id: int = Field(foreign_key="users.id", index=True)
     title: str = Field(max_length=200)
-    query_type: QueryType
-    language: Language
-    is_active: bool = Field(default=True)
-    session_context: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))  # Applied user context
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    query_type: QueryType = Field(sa_column=_enum_column(QueryType))
+    language: Language = Field(sa_column=_enum_column(Language))
+    is_active: bool = Field(default=True, sa_column_kwargs={"server_default": text("true")})
+    session_context: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONB))  # Applied user context
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
+
+    __table_args__ = (Index("ix_chat_sessions_user_active_created", "user_id", "is_active", "created_at"),)
 
     user: User = Relationship(back_populates="chat_sessions")
-    queries: List["Query"] = Relationship(back_populates="chat_session")
+    queries: List["Query"] = Relationship(back_populates="chat_session", sa_relationship_kwargs={"lazy": "selectin"})
     document_links: List["ChatSessionDocument"] = Relationship(back_populates="chat_session")
 
 
@@ -235,32 +401,100 @@ class ChatSessionDocument(SQLModel, table=True):
 
     chat_session_id: int = Field(foreign_key="chat_sessions.id", primary_key=True)
     document_id: int = Field(foreign_key="documents.id", primary_key=True)
-    added_at: datetime = Field(default_factory=datetime.utcnow)
+    added_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
 
     chat_session: "ChatSession" = Relationship()
     document: "Document" = Relationship()
 
+    @classmethod
+    def bulk_attach(cls, session: Session, chat_session_id: int, document_ids: List[int]) -> None:
+        """Attach many documents to a chat session in one multi-row INSERT.
+
+        Already-attached documents are skipped via ON CONFLICT DO NOTHING, so the
+        call is idempotent and never costs more than a single round trip.
+        """
+        if not document_ids:
+            return
+        stmt = (
+            pg_insert(SQLModel.metadata.tables["chat_session_documents"])
+            .values([{"chat_session_id": chat_session_id, "document_id": d} for d in document_ids])
+            .on_conflict_do_nothing()
+        )
+        session.execute(stmt)
+
 
 class Query(SQLModel, table=True):
     __tablename__ = "queries"  # type: ignore[assignment]
+    model_config = ConfigDict(ignored_types=(hybrid_property,))  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id")
-    chat_session_id: Optional[int] = Field(default=None, foreign_key="chat_sessions.id")
-    query_type: QueryType
+    user_id: int = Field(foreign_key="users.id", index=True)
+    chat_session_id: Optional[int] = Field(default=None, foreign_key="chat_sessions.id", index=True)
+    # query_type and language packed into one SMALLINT (see pack_qt_lang); on a
+    # many-million-row table the narrower row raises rows-per-page noticeably
+    qt_lang: int = Field(sa_column=Column(SmallInteger, nullable=False))
     query_text: str = Field(max_length=5000)
-    response_text: str = Field(default="")
-    language: Language
-    tokens_consumed: int = Field(default=0)
+    tokens_consumed: int = Field(default=0, sa_column_kwargs={"server_default": text("0")})
     processing_time_ms: Optional[int] = Field(default=None)
-    sources: List[Dict[str, Any]] = Field(default=[], sa_column=Column(JSON))  # References to original sources
-    chunks: List[Dict[str, Any]] = Field(default=[], sa_column=Column(JSON))  # Document chunks for Light version
-    context_used: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))  # User context applied to this query
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+
+    __table_args__ = (Index("ix_queries_user_created", "user_id", "created_at"),)
+
+    # Read-only unpacked views; construct/update rows with qt_lang=pack_qt_lang(...).
+    # The SQL expressions yield the member's int value, so filters like
+    # Query.query_type == QueryType.MAIN compare as plain integers.
+    @hybrid_property
+    def query_type(self) -> QueryType:
+        return _QUERY_TYPES[self.qt_lang >> _LANGUAGE_BITS]
+
+    @query_type.inplace.expression
+    @classmethod
+    def _query_type_expression(cls):
+        return col(cls.qt_lang).op(">>")(_LANGUAGE_BITS)
+
+    @hybrid_property
+    def language(self) -> Language:
+        return _LANGUAGES[self.qt_lang & ((1 << _LANGUAGE_BITS) - 1)]
+
+    @language.inplace.expression
+    @classmethod
+    def _language_expression(cls):
+        return col(cls.qt_lang).op("&")((1 << _LANGUAGE_BITS) - 1)
+
+    @model_serializer(mode="wrap")
+    def _serialize_with_unpacked_enums(self, handler: Any, info: SerializationInfo) -> Dict[str, Any]:
+        # hybrids aren't pydantic fields, so add the unpacked values explicitly;
+        # API consumers shouldn't have to decode the qt_lang bitfield
+        data = handler(self)
+        if info.mode == "json":
+            data["query_type"] = self.query_type.code
+            data["language"] = self.language.code
+        else:
+            data["query_type"] = self.query_type
+            data["language"] = self.language
+        return data
 
     user: User = Relationship(back_populates="queries")
     chat_session: Optional[ChatSession] = Relationship(back_populates="queries")
     token_usage: Optional[TokenUsage] = Relationship(back_populates="query", sa_relationship_kwargs={"uselist": False})
+    # Heavy JSON/text lives in QueryPayload; lazy="raise" makes accidental wide loads explicit
+    payload: Optional["QueryPayload"] = Relationship(
+        back_populates="query", sa_relationship_kwargs={"lazy": "raise", "uselist": False}
+    )
+
+
+class QueryPayload(SQLModel, table=True):
+    """Heavy response data split off the queries table so list views stay narrow."""
+
+    __tablename__ = "query_payloads"  # type: ignore[assignment]
+
+    query_id: int = Field(foreign_key="queries.id", primary_key=True)
+    response_text: str = Field(default="")
+    sources: List[Dict[str, Any]] = Field(default_factory=list, sa_column=Column(JSONB))  # References to original sources
+    chunks: List[Dict[str, Any]] = Field(default_factory=list, sa_column=Column(JSONB))  # Document chunks for Light version
+    context_used: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONB))  # User context applied to this query
+
+    query: "Query" = Relationship(back_populates="payload")
 
 
 # Billing and payment tracking
@@ -268,14 +502,14 @@ class BillingRecord(SQLModel, table=True):
     __tablename__ = "billing_records"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id")
+    user_id: int = Field(foreign_key="users.id", index=True)
     subscription_id: int = Field(foreign_key="subscriptions.id")
     billing_period_start: datetime
     billing_period_end: datetime
     total_tokens: int
     total_cost: Decimal = Field(decimal_places=2, max_digits=10)
     currency: str = Field(default="EUR", max_length=3)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
 
     user: "User" = Relationship()
     subscription: "Subscription" = Relationship()
@@ -283,6 +517,8 @@ class BillingRecord(SQLModel, table=True):
 
 # Non-persistent schemas for validation and API
 class UserCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, from_attributes=False)  # type: ignore[assignment]
+
     email: str = Field(max_length=255)
     password: str = Field(min_length=8)
     user_type: UserType
@@ -290,15 +526,19 @@ class UserCreate(SQLModel, table=False):
 
 
 class UserContextCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, from_attributes=False)  # type: ignore[assignment]
+
     user_type_context: str = Field(max_length=50)
     home_location: str = Field(max_length=100)
     preferred_language: Language
     profession: str = Field(max_length=100)
     personal_notes: str = Field(default="", max_length=2000)
-    context_data: Dict[str, Any] = Field(default={})
+    context_data: Dict[str, Any] = Field(default_factory=dict)
 
 
 class UserContextUpdate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, from_attributes=False)  # type: ignore[assignment]
+
     user_type_context: Optional[str] = Field(default=None, max_length=50)
     home_location: Optional[str] = Field(default=None, max_length=100)
     preferred_language: Optional[Language] = Field(default=None)
@@ -308,14 +548,18 @@ class UserContextUpdate(SQLModel, table=False):
 
 
 class OrganizationCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, from_attributes=False)  # type: ignore[assignment]
+
     name: str = Field(max_length=200)
     company_type: CompanyType
     company_size: CompanySize
     headquarters_location: str = Field(max_length=100)
-    subsidiary_locations: List[str] = Field(default=[])
+    subsidiary_locations: List[str] = Field(default_factory=list)
 
 
 class QueryCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, from_attributes=False)  # type: ignore[assignment]
+
     query_text: str = Field(max_length=5000)
     query_type: QueryType
     language: Language
@@ -323,17 +567,23 @@ class QueryCreate(SQLModel, table=False):
 
 
 class SubscriptionCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, from_attributes=False)  # type: ignore[assignment]
+
     pricing_plan: PricingPlan
     token_allowance: Optional[int] = Field(default=None)
     week_pass_price: Optional[Decimal] = Field(default=None)
 
 
 class APIKeyCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, from_attributes=False)  # type: ignore[assignment]
+
     name: str = Field(max_length=100)
     expires_at: Optional[datetime] = Field(default=None)
 
 
 class DocumentUpload(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, from_attributes=False)  # type: ignore[assignment]
+
     filename: str = Field(max_length=255)
     file_size: int
     mime_type: str = Field(max_length=100)
@@ -341,7 +591,34 @@ class DocumentUpload(SQLModel, table=False):
 
 
 class ChatSessionCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, from_attributes=False)  # type: ignore[assignment]
+
     title: str = Field(max_length=200)
     query_type: QueryType
     language: Language
-    document_ids: List[int] = Field(default=[])
+    document_ids: List[int] = Field(default_factory=list)
+
+
+# Serialization fast paths for the most-returned models: resolve each model's
+# pydantic-core serializer once at import time; API handlers call these instead
+# of model_dump_json(), which re-looks-up the serializer on every call.
+_USER_SERIALIZER = User.__pydantic_serializer__
+_USER_CONTEXT_SERIALIZER = UserContext.__pydantic_serializer__
+_CHAT_SESSION_SERIALIZER = ChatSession.__pydantic_serializer__
+_QUERY_SERIALIZER = Query.__pydantic_serializer__
+
+
+def user_to_json(user: User) -> bytes:
+    return _USER_SERIALIZER.to_json(user)
+
+
+def user_context_to_json(user_context: UserContext) -> bytes:
+    return _USER_CONTEXT_SERIALIZER.to_json(user_context)
+
+
+def chat_session_to_json(chat_session: ChatSession) -> bytes:
+    return _CHAT_SESSION_SERIALIZER.to_json(chat_session)
+
+
+def query_to_json(query: Query) -> bytes:
+    return _QUERY_SERIALIZER.to_json(query)
@@ -1,11 +1,28 @@
+import asyncio
+from typing import Optional
+
 from app.database import create_tables
+from app.touches import run_touch_flusher
 from nicegui import ui
 
+# the event loop keeps only weak references to tasks, so hold a strong one
+# here to stop the flusher from being garbage-collected mid-run
+_touch_flusher_task: Optional["asyncio.Task[None]"] = None
+
 
 def startup() -> None:
     # this function is called before the first request
     create_tables()
 
+    # periodically batch-writes hot status timestamps (e.g. APIKey.last_used_at)
+    global _touch_flusher_task
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        pass  # called outside the event loop (e.g. sync test fixture); nothing to flush there
+    else:
+        _touch_flusher_task = loop.create_task(run_touch_flusher())
+
     @ui.page("/")
     def index():
         ui.label("🚧 Work in progress 🚧").style("font-size: 2rem; text-align: center; margin-top: 2rem")
@@ -0,0 +1,90 @@
+"""Write-behind batching for hot status timestamps.
+
+APIKey.last_used_at fires on every authenticated request and
+Document.processed_at on every bulk-ingested file; writing them
+synchronously turns each event into an extra UPDATE round trip. Instead,
+touches are recorded in-process and flushed periodically as a single
+multi-row ``UPDATE ... FROM (VALUES ...)``, collapsing O(requests)
+round trips into O(1) per flush interval.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Dict
+
+from sqlalchemy import Integer, DateTime, Table, column, update, values
+from sqlmodel import SQLModel
+
+from app.database import ENGINE
+
+# Import the models so their tables are registered on the metadata
+from app.models import APIKey, Document  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+_api_keys_table: Table = SQLModel.metadata.tables["api_keys"]
+_documents_table: Table = SQLModel.metadata.tables["documents"]
+
+FLUSH_INTERVAL_SECONDS = 5.0
+
+_lock = Lock()
+_api_key_touches: Dict[int, datetime] = {}
+_document_touches: Dict[int, datetime] = {}
+
+
+def record_api_key_use(api_key_id: int, at: datetime | None = None) -> None:
+    """Note that an API key was just used; persisted on the next flush."""
+    with _lock:
+        _api_key_touches[api_key_id] = at or datetime.now(timezone.utc)
+
+
+def record_document_processed(document_id: int, at: datetime | None = None) -> None:
+    """Note that a document finished processing; persisted on the next flush."""
+    with _lock:
+        _document_touches[document_id] = at or datetime.now(timezone.utc)
+
+
+def _flush_table(touches: Dict[int, datetime], table: Table, ts_column_name: str) -> int:
+    with _lock:
+        if not touches:
+            return 0
+        pending = dict(touches)
+        touches.clear()
+
+    v = values(
+        column("id", Integer),
+        column("ts", DateTime(timezone=True)),
+        name="v",
+    ).data(sorted(pending.items()))
+    stmt = update(table).where(table.c.id == v.c.id).values({ts_column_name: v.c.ts})
+    try:
+        with ENGINE.begin() as conn:
+            conn.execute(stmt)
+    except Exception:
+        # put the touches back so a transient DB failure doesn't drop them;
+        # a fresher touch recorded in the meantime wins
+        with _lock:
+            for row_id, ts in pending.items():
+                if row_id not in touches or touches[row_id] < ts:
+                    touches[row_id] = ts
+        raise
+    return len(pending)
+
+
+def flush_touches() -> int:
+    """Flush all pending touches in one UPDATE per table; returns rows written."""
+    written = _flush_table(_api_key_touches, _api_keys_table, "last_used_at")
+    written += _flush_table(_document_touches, _documents_table, "processed_at")
+    return written
+
+
+async def run_touch_flusher(interval: float = FLUSH_INTERVAL_SECONDS) -> None:
+    """Background loop that flushes pending touches every `interval` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(flush_touches)
+        except Exception:
+            logger.exception("Failed to flush timestamp touches")
@@ -0,0 +1,89 @@
+"""Unit tests for model helpers that don't need a database."""
+
+import json
+from typing import cast
+
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session
+
+from app.models import (
+    ChatSessionDocument,
+    Language,
+    Query,
+    QueryCreate,
+    QueryType,
+    User,
+    UserType,
+    pack_qt_lang,
+    query_to_json,
+    user_to_json,
+)
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+
+
+def test_bulk_attach_emits_single_multirow_insert():
+    session = _RecordingSession()
+
+    ChatSessionDocument.bulk_attach(cast(Session, session), chat_session_id=1, document_ids=[10, 11, 12])
+
+    assert len(session.statements) == 1
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "INSERT INTO chat_session_documents" in sql
+    assert "ON CONFLICT DO NOTHING" in sql
+    assert sql.count("%(chat_session_id") == 3  # one VALUES row per document, one statement
+
+
+def test_bulk_attach_without_documents_is_a_no_op():
+    session = _RecordingSession()
+
+    ChatSessionDocument.bulk_attach(cast(Session, session), chat_session_id=1, document_ids=[])
+
+    assert session.statements == []
+
+
+def test_enum_members_are_ints_with_str_codes():
+    assert QueryType.MAIN == 1
+    assert Language("en") is Language.EN  # str codes accepted on input
+    assert Language.EN.code == "en"
+    assert tuple(member.code for member in Language) == Language.__codes__
+
+
+def test_enum_codes_round_trip_through_json():
+    created = QueryCreate(query_text="hi", query_type="main", language="de")  # type: ignore[arg-type]
+    data = json.loads(created.model_dump_json())
+
+    assert data["query_type"] == "main"
+    assert data["language"] == "de"
+
+    again = QueryCreate.model_validate(data)
+    assert again.query_type is QueryType.MAIN
+    assert again.language is Language.DE
+
+
+def test_cached_serializer_emits_enum_codes():
+    user = User(id=1, email="a@b.c", user_type=UserType.B2B)
+
+    assert json.loads(user_to_json(user))["user_type"] == "b2b"
+
+
+def test_pack_qt_lang_round_trips_every_combination():
+    for query_type in QueryType:
+        for language in Language:
+            query = Query(user_id=1, qt_lang=pack_qt_lang(query_type, language), query_text="x")
+            assert query.query_type is query_type
+            assert query.language is language
+
+
+def test_query_json_exposes_unpacked_enums():
+    query = Query(id=1, user_id=1, qt_lang=pack_qt_lang(QueryType.MAIN, Language.DE), query_text="x")
+    data = json.loads(query_to_json(query))
+
+    assert data["query_type"] == "main"
+    assert data["language"] == "de"